@@ -15,6 +15,8 @@ L4S_TOS=1
 CLASSIC_TOS=0
 DELAY=0
 PKTS=200
+UPLINK_QUEUE="dualPI2"
+UPLINK_QUEUE_ARGS="packets=${PKTS},target=16,tupdate=16,alpha=0.16,beta=3"
 
 # ========== Helper: Clean Up Mahimahi Environment ==========
 cleanup_network() {
@@ -104,14 +106,17 @@ while [[ $RUNS_LEFT -gt 0 ]]; do
   echo "[*] Starting DualPI2 L4S test in 2 seconds..."
   sleep 2
 
+  # Record the queue configuration so the run index can pick it up
+  {
+    echo "start: $(date +%s.%N)"
+    echo "uplink-queue: $UPLINK_QUEUE"
+    echo "uplink-queue-args: $UPLINK_QUEUE_ARGS"
+    echo "uplink-trace: $(basename "$TRACE_UP")"
+  } >> "$OUT_FILE"
+
   mm-delay $DELAY mm-link --meter-all \
-    --uplink-queue=dualPI2 \
-    --uplink-queue-args="\
-      packets=${PKTS},\
-      target=16,\
-      tupdate=16,\
-      alpha=0.16,\
-      beta=3" \
+    --uplink-queue="$UPLINK_QUEUE" \
+    --uplink-queue-args="$UPLINK_QUEUE_ARGS" \
     "$TRACE_UP" "$TRACE_DOWN" -- bash -c "
       echo '[+] Starting constant UDP iperf3 flow (port 5300)...'
       iperf3 -c 10.0.0.1 -p 5300 -u -b 12M -l 1200 -t $SECS --tos $CLASSIC_TOS --interval 1 \
@@ -0,0 +1,482 @@
+import json
+import math
+import re
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from multiprocessing import Pool, cpu_count
+
+# Only the standard library is imported here: worker processes re-import
+# this module (and the CLI entry point) on spawn, so keep plotting and
+# stats libraries out of it.
+
+# ============ Paths ============
+try:
+    BASE_DIR = Path(__file__).resolve().parent
+except NameError:
+    BASE_DIR = Path.cwd()
+
+QDISC_DIR = BASE_DIR / "tmp"
+OUTPUT_DIR = BASE_DIR / "outputs"
+
+CACHE_FILES = {
+    "qdisc": BASE_DIR / "dtw_cache_qdisc.txt",
+    "mahi": BASE_DIR / "dtw_cache_mahi.txt",
+    "cross": BASE_DIR / "dtw_cache_differences.txt",
+}
+
+INDEX_FILE = BASE_DIR / "run_index.json"
+INDEX_VERSION = 4
+
+RUN_GLOBS = {
+    "qdisc": (QDISC_DIR, "qdisc_*.log"),
+    "mahi": (OUTPUT_DIR, "output_*.txt"),
+}
+
+MAHI_SAMPLE_MS = 16
+
+# ============ Parsers ============
+HEADER_RE = re.compile(r"^------ (.+) ------\s*$")
+BACKLOG_RE = re.compile(r"backlog\s+(\d+)b\s+\d+p")
+
+def read_qdisc_series(path: str | Path):
+    ys = []
+    pending = False
+    with open(path, "r") as f:
+        for line in f:
+            if HEADER_RE.match(line):
+                pending = True
+                continue
+            if pending:
+                m = BACKLOG_RE.search(line)
+                if m:
+                    ys.append(int(m.group(1)))
+                    pending = False
+    return ys
+
+def read_mahi_series(path: str | Path):
+    ys = []
+    with open(path, "r") as f:
+        for line in f:
+            if "queue size in bytes:" in line:
+                try:
+                    ys.append(int(line.strip().split(":")[-1].strip()))
+                except ValueError:
+                    pass
+    return ys
+
+READERS = {
+    "qdisc": read_qdisc_series,
+    "mahi": read_mahi_series,
+}
+
+def run_index(path: Path):
+    return int(path.stem.split("_")[1])
+
+def list_runs(mode, directory: Path | None = None):
+    default_dir, pattern = RUN_GLOBS[mode]
+    directory = Path(directory) if directory else default_dir
+    return sorted(((run_index(f), f) for f in directory.glob(pattern)), key=lambda p: p[0])
+
+def load_series(mode, directory: Path | None = None):
+    reader = READERS[mode]
+    return {idx: reader(f) for idx, f in list_runs(mode, directory)}
+
+# ============ DTW ============
+def dtw_distance(a, b):
+    n, m = len(a), len(b)
+    if n == 0 or m == 0:
+        return float(abs(sum(a) - sum(b)))
+    INF = float("inf")
+    prev = [INF] * (m + 1)
+    curr = [INF] * (m + 1)
+    prev[0] = 0.0
+    for i in range(1, n + 1):
+        curr[0] = INF
+        ai = a[i - 1]
+        for j in range(1, m + 1):
+            bj = b[j - 1]
+            cost = abs(ai - bj)
+            curr[j] = cost + min(prev[j], curr[j - 1], prev[j - 1])
+        prev, curr = curr, prev
+    return prev[m]
+
+def compute_pair(job):
+    i, j, a, b = job
+    if not a or not b:
+        return (i, j, None)
+    d = dtw_distance(a, b) / max(len(a), len(b))  # normalize
+    return (i, j, d)
+
+def run_pairs(jobs, workers=None):
+    """Yield (i, j, d) for each job as workers finish, in completion order."""
+    workers = workers or max(1, cpu_count() - 1)
+    if not jobs:
+        return
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with Pool(processes=workers) as pool:
+        yield from pool.imap_unordered(compute_pair, jobs, chunksize=chunksize)
+
+# ============ Cache Utilities ============
+def load_cache(path: Path, symmetric=True):
+    cache = {}
+    if not path.exists():
+        return cache
+    with open(path, "r") as f:
+        for line in f:
+            parts = line.strip().split(",")
+            if len(parts) != 3:
+                continue
+            i, j, d = int(parts[0]), int(parts[1]), float(parts[2])
+            cache[(i, j)] = d
+            if symmetric:
+                cache[(j, i)] = d
+    return cache
+
+def append_to_cache(path: Path, i, j, d):
+    with open(path, "a") as f:
+        f.write(f"{i},{j},{d:.6f}\n")
+
+def write_cache(path: Path, results):
+    with open(path, "w") as f:
+        for i, j, d in results:
+            f.write(f"{i},{j},{d:.6f}\n")
+
+def load_dtw_dict(files=CACHE_FILES):
+    """Merge the three caches into one dict keyed by tagged labels ("3_q", "7_m")."""
+    dtw_dict = {}
+    tags = {"qdisc": ("q", "q"), "mahi": ("m", "m"), "cross": ("q", "m")}
+    for name, (ta, tb) in tags.items():
+        for (i, j), d in load_cache(files[name], symmetric=False).items():
+            dtw_dict[(f"{i}_{ta}", f"{j}_{tb}")] = d
+    return dtw_dict
+
+# ============ Run Index ============
+# One entry per run, built at ingest (`parse`) so sweeps, stats and plots can
+# select comparable runs without re-reading raw logs.
+
+QDISC_CONFIG_KEYS = ("limit", "target", "tupdate", "alpha", "beta",
+                     "coupling_factor", "step_thresh", "classic_protection")
+QDISC_CONFIG_RE = re.compile(r"^qdisc (\w+) \S+ parent \S+ (.*)$")
+HTB_CLASS_RE = re.compile(r"^class htb \S+ .*\brate (\S+)")
+CONFIGURED_RE = re.compile(r"^config:\s*(.*)$")
+MAHI_META_RE = re.compile(r"^(start|uplink-queue|uplink-queue-args|uplink-trace):\s*(.*)$")
+
+# mahimahi --uplink-queue-args name -> (qdisc config key, implied unit), so the
+# two systems' runs can be selected and grouped on the same keys.
+MAHI_ARG_KEYS = {
+    "packets": ("limit", "p"),
+    "target": ("target", "ms"),
+    "tupdate": ("tupdate", "ms"),
+    "max_rtt": ("max_rtt", "ms"),
+}
+
+TZ_OFFSETS = {"UTC": 0, "GMT": 0, "PST": -8, "PDT": -7, "MST": -7, "MDT": -6,
+              "CST": -6, "CDT": -5, "EST": -5, "EDT": -4}
+
+# `date` output in the en_US and C locales, as logged before run_many.sh
+# switched to epoch seconds
+DATE_FORMATS = ("%a %d %b %Y %I:%M:%S %p", "%a %b %d %H:%M:%S %Y")
+
+def parse_header_time(text):
+    """Epoch seconds for a `------ <date> ------` header, or None.
+
+    run_many.sh logs `date +%s.%N`; ISO 8601 and the `date` formats of
+    older logs (with a zone from TZ_OFFSETS) are accepted as fallbacks.
+    """
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    try:
+        stamp = datetime.fromisoformat(text)
+        if stamp.tzinfo is not None:
+            return stamp.timestamp()
+    except ValueError:
+        pass
+    tokens = text.split()
+    zones = [t for t in tokens if t in TZ_OFFSETS]
+    if len(zones) != 1:
+        return None
+    tokens.remove(zones[0])
+    tz = timezone(timedelta(hours=TZ_OFFSETS[zones[0]]))
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(" ".join(tokens), fmt).replace(tzinfo=tz).timestamp()
+        except ValueError:
+            continue
+    return None
+
+def scan_qdisc_run(path: Path):
+    config = {}
+    configured = {}
+    first = last = None
+    samples = 0
+    pending = False
+    with open(path, "r") as f:
+        for line in f:
+            m = HEADER_RE.match(line)
+            if m:
+                stamp = m.group(1)
+                first = first if first is not None else stamp
+                last = stamp
+                pending = True
+                continue
+            if pending and BACKLOG_RE.search(line):
+                samples += 1
+                pending = False
+            if "kind" not in config:
+                m = QDISC_CONFIG_RE.match(line)
+                if m and m.group(1) != "htb":
+                    config["kind"] = m.group(1)
+                    tokens = m.group(2).split()
+                    for k, tok in enumerate(tokens[:-1]):
+                        if tok in QDISC_CONFIG_KEYS:
+                            config[tok] = tokens[k + 1]
+            if "rate" not in config:
+                m = HTB_CLASS_RE.match(line)
+                if m:
+                    config["rate"] = m.group(1).lower()
+            m = CONFIGURED_RE.match(line)
+            if m:
+                configured.update(item.split("=", 1) for item in m.group(1).split() if "=" in item)
+
+    # Values run_many.sh asked for win over what tc reports back (tc rounds
+    # alpha/beta); keys still holding tc's echo are listed in "echoed"
+    echoed = sorted(k for k in TC_STEPS if k in config and k not in configured)
+    config.update(configured)
+    start_ts = parse_header_time(first) if first else None
+    end_ts = parse_header_time(last) if last else None
+    duration = end_ts - start_ts if start_ts is not None and end_ts is not None else None
+    return {"samples": samples, "start": first, "start_ts": start_ts,
+            "duration": duration, "config": config, "echoed": echoed}
+
+def scan_mahi_run(path: Path):
+    config = {}
+    start = None
+    samples = 0
+    with open(path, "r") as f:
+        for line in f:
+            if "queue size in bytes:" in line:
+                samples += 1
+                continue
+            m = MAHI_META_RE.match(line.strip())
+            if not m:
+                continue
+            key, value = m.groups()
+            if key == "start":
+                start = value.strip()
+            elif key == "uplink-queue":
+                config["kind"] = value.strip().lower()
+            elif key == "uplink-trace":
+                config["trace"] = value.strip()
+            else:
+                config["args"] = value.strip()
+                for item in value.split(","):
+                    if "=" in item:
+                        k, v = (t.strip() for t in item.split("=", 1))
+                        k, unit = MAHI_ARG_KEYS.get(k, (k, ""))
+                        config[k] = v + unit
+    return {"samples": samples, "start": start, "start_ts": parse_header_time(start) if start else None,
+            "duration": samples * MAHI_SAMPLE_MS / 1000, "config": config}
+
+SCANNERS = {
+    "qdisc": scan_qdisc_run,
+    "mahi": scan_mahi_run,
+}
+
+def run_key(path: Path):
+    """Index key for a run file: relative to BASE_DIR when possible."""
+    path = path.resolve()
+    try:
+        return str(path.relative_to(BASE_DIR))
+    except ValueError:
+        return str(path)
+
+def run_path(entry):
+    return BASE_DIR / entry["file"]
+
+def read_index(path: Path = INDEX_FILE):
+    """The index as stored on disk: {"assumed", "dirs", "runs"}.
+
+    `assumed` maps system -> {key: value}; `dirs` maps system -> the log
+    directory it was last indexed from.
+    """
+    empty = {"assumed": {}, "dirs": {}, "runs": []}
+    if not path.exists():
+        return empty
+    with open(path, "r") as f:
+        data = json.load(f)
+    if isinstance(data, list) or data.get("version") != INDEX_VERSION:
+        # Index written by an older layout; rescan every run
+        return empty
+    return data
+
+def load_index(path: Path = INDEX_FILE):
+    """Indexed runs, each carrying the assumed values for its system."""
+    data = read_index(path)
+    for entry in data["runs"]:
+        entry["assumed"] = data["assumed"].get(entry["system"], {})
+    return data["runs"]
+
+def build_index(path: Path = INDEX_FILE, systems=("qdisc", "mahi"), dirs=None, assume=(), rebuild=False):
+    """Scan new or changed runs of `systems` into the index; unchanged runs are
+    reused as-is and other systems' entries are kept. A system without an
+    entry in `dirs` is rescanned from the directory it was last indexed from.
+
+    `assume` is a list of (system or None, key, value) giving config values
+    the logs do not record (e.g. the htb rate of runs logged before
+    run_many.sh wrote it out). They are stored apart from the scanned config,
+    only apply where a run's log lacks the key, and replace earlier
+    assumptions for the same key; an empty value drops the assumption.
+    """
+    dirs = dirs or {}
+    data = read_index(path)
+    assumed, indexed_dirs, previous = data["assumed"], data["dirs"], data["runs"]
+    for system, key, value in assume:
+        for target in [system] if system else list(RUN_GLOBS):
+            if value:
+                assumed.setdefault(target, {})[key] = value
+            else:
+                assumed.get(target, {}).pop(key, None)
+
+    known = {} if rebuild else {(e["system"], e["file"]): e for e in previous}
+    entries = [e for e in previous if e["system"] not in systems]
+    for system in systems:
+        directory = Path(dirs.get(system) or indexed_dirs.get(system) or RUN_GLOBS[system][0])
+        indexed_dirs[system] = str(directory.resolve())
+        for idx, f in list_runs(system, directory):
+            stat = f.stat()
+            key = run_key(f)
+            entry = known.get((system, key))
+            if not entry or entry["size"] != stat.st_size or entry["mtime"] != stat.st_mtime:
+                entry = {"system": system, "run": idx, "file": key,
+                         "size": stat.st_size, "mtime": stat.st_mtime, **SCANNERS[system](f)}
+            entries.append(entry)
+    with open(path, "w") as f:
+        json.dump({"version": INDEX_VERSION, "assumed": assumed, "dirs": indexed_dirs, "runs": entries},
+                  f, indent=1)
+    return load_index(path)
+
+# ============ Run Selection ============
+PREDICATE_RE = re.compile(r"^(?:(qdisc|mahi)\.)?([\w-]+)\s*(!=|<=|>=|=|<|>)\s*(.+)$")
+
+def parse_predicate(text):
+    """`[system.]key OP value` -> (system or None, key, op, value)."""
+    m = PREDICATE_RE.match(text.strip())
+    if not m:
+        raise ValueError(f"invalid predicate {text!r}; expected e.g. alpha=0.152344 or qdisc.rate=12mbit")
+    return m.groups()
+
+ASSUME_RE = re.compile(r"^(?:(qdisc|mahi)\.)?([\w-]+)=(.*)$")
+
+def parse_assumption(text):
+    """`[system.]key=value` -> (system or None, key, value); value may be empty."""
+    m = ASSUME_RE.match(text.strip())
+    if not m:
+        raise ValueError(f"invalid assumption {text!r}; expected e.g. qdisc.rate=12mbit")
+    system, key, value = m.groups()
+    return system, key, value.strip()
+
+def field(entry, key):
+    """Run attribute, scanned config value, or assumed value, in that order."""
+    if key in entry and key not in ("config", "assumed"):
+        return entry[key]
+    if key in entry["config"]:
+        return entry["config"][key]
+    return entry.get("assumed", {}).get(key)
+
+# Units tc and mahimahi print, scaled to one base per quantity: microseconds,
+# bits/s, bytes, packets and percent. A bare number is taken as-is, except
+# for the run attributes in FIELD_UNITS, which the index keeps in seconds.
+UNIT_SCALES = {
+    "": 1, "us": 1, "ms": 1e3, "s": 1e6,
+    "bit": 1, "kbit": 1e3, "mbit": 1e6, "gbit": 1e9,
+    "b": 1, "k": 1024, "kb": 1024, "mb": 1024 ** 2,
+    "p": 1, "%": 1,
+}
+FIELD_UNITS = {"start_ts": "s", "duration": "s"}
+NUMBER_RE = re.compile(r"^([-+]?(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?)\s*([a-z%]*)$")
+
+# tc truncates alpha and beta to 1/256 steps before handing them to the
+# kernel, and the kernel's round trip drops one more step when they are
+# printed: alpha 0.15625 comes back as 0.152344, beta 3.195312 as 3.187500.
+TC_STEPS = {"alpha": 256, "beta": 256}
+
+def tc_echo(key, value):
+    """What tc prints for `key` configured as `value`."""
+    steps = TC_STEPS[key]
+    return (math.floor(value * steps + 1e-6) - 1) / steps
+
+def is_echoed(entry, key):
+    """True when the entry's `key` is tc's echo rather than the configured value."""
+    return key in TC_STEPS and key in entry.get("echoed", ())
+
+def _coerce(value, key=None):
+    """Number in base units when `value` parses as one, else lowercase text."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value) * UNIT_SCALES[FIELD_UNITS.get(key, "")]
+    text = str(value).strip().lower()
+    m = NUMBER_RE.match(text)
+    if m and m.group(2) in UNIT_SCALES:
+        return float(m.group(1)) * UNIT_SCALES[m.group(2) or FIELD_UNITS.get(key, "")]
+    return text
+
+def close(a, b):
+    # tc prints six decimals
+    return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-6)
+
+def matches(entry, predicates):
+    for system, key, op, want in predicates:
+        if system and system != entry["system"]:
+            continue
+        have, want = _coerce(field(entry, key), key), _coerce(want, key)
+        if have is None or type(have) is not type(want):
+            if op != "!=":
+                return False
+            continue
+        if isinstance(have, float):
+            if is_echoed(entry, key):
+                want = tc_echo(key, want)
+            eq = close(have, want)
+            ok = {"=": eq, "!=": not eq, "<": have < want and not eq, "<=": have < want or eq,
+                  ">": have > want and not eq, ">=": have > want or eq}[op]
+        else:
+            ok = {"=": have == want, "!=": have != want, "<": have < want,
+                  "<=": have <= want, ">": have > want, ">=": have >= want}[op]
+        if not ok:
+            return False
+    return True
+
+def select_runs(index, system, predicates=()):
+    return [e for e in index if e["system"] == system and matches(e, predicates)]
+
+def group_runs(entries, key):
+    """Group entries by the normalised value of `key` (see UNIT_SCALES).
+
+    Values as configured group exactly. A value tc echoed back joins the
+    configured group it is the echo of when there is exactly one such group,
+    otherwise it is grouped under the echoed value, so the result does not
+    depend on the order of `entries`. Runs missing the field are grouped
+    under None. Pass both systems' entries in one call so their groups line up.
+    """
+    groups = {}
+    echoes = []
+    for e in entries:
+        v = _coerce(field(e, key), key)
+        if isinstance(v, float) and is_echoed(e, key):
+            echoes.append((v, e))
+        else:
+            groups.setdefault(v, []).append(e)
+    configured = [g for g in groups if isinstance(g, float)]
+    for v, e in echoes:
+        owners = [g for g in configured if close(v, tc_echo(key, g))]
+        groups.setdefault(owners[0] if len(owners) == 1 else v, []).append(e)
+    return groups
+
+def group_order(value):
+    """Sort key for group values of mixed type: numbers, then text, then None."""
+    if isinstance(value, float):
+        return (0, value, "")
+    return (1, 0, value) if value is not None else (2, 0, "")
@@ -0,0 +1,117 @@
+from pathlib import Path
+import matplotlib.pyplot as plt
+import seaborn as sns
+import pandas as pd
+
+# Heavy plotting imports live here; only the render/watch stages (and
+# `stats --plot`) import this module.
+
+# ============ Output ============
+def finish(name, out_dir: Path | None = None):
+    plt.tight_layout()
+    if out_dir:
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        plt.savefig(out_dir / f"{name}.png")
+        plt.close()
+    else:
+        plt.show()
+
+# ============ DTW Distributions ============
+def plot_matrix(distances, rows, cols, title, xlabel="Index", ylabel="Index",
+                fmt=".2f", cmap="coolwarm", cbar_label="Normalized DTW", out_dir=None):
+    matrix_df = pd.DataFrame(index=rows, columns=cols, dtype=float)
+    for (i, j), d in distances.items():
+        if i in matrix_df.index and j in matrix_df.columns:
+            matrix_df.at[i, j] = d
+
+    plt.figure(figsize=(10, 8))
+    sns.heatmap(matrix_df, annot=True, fmt=fmt, cmap=cmap, cbar_kws={"label": cbar_label})
+    plt.title(title)
+    plt.xlabel(xlabel)
+    plt.ylabel(ylabel)
+    finish("matrix", out_dir)
+
+def plot_cdf(values, title, out_dir=None):
+    sorted_vals = sorted(values)
+    cdf = [i / len(sorted_vals) for i in range(len(sorted_vals))]
+
+    plt.figure(figsize=(8, 6))
+    plt.plot(sorted_vals, cdf, linewidth=2)
+    plt.xlabel("Normalized DTW Distance")
+    plt.ylabel("CDF")
+    plt.title(title)
+    plt.grid(True)
+    finish("cdf", out_dir)
+
+def plot_pdf(values, title, kde=False, out_dir=None):
+    plt.figure(figsize=(8, 6))
+    if kde:
+        sns.histplot(values, bins=30, kde=True, stat="density", edgecolor='black', alpha=0.7)
+    else:
+        plt.hist(values, bins=30, density=True, alpha=0.7, edgecolor='black')
+    plt.xlabel("Normalized DTW Distance")
+    plt.ylabel("Probability Density")
+    plt.title(title)
+    plt.grid(True)
+    finish("pdf", out_dir)
+
+def plot_box(values, title, out_dir=None):
+    plt.figure(figsize=(8, 5))
+    box = plt.boxplot(values, patch_artist=True, showmeans=True)
+    for patch in box['boxes']:
+        patch.set_facecolor('#a2cffe')
+
+    plt.xticks([])
+    plt.ylabel("Normalized DTW Distance")
+    plt.title(title)
+    plt.grid(True, axis='y', linestyle='--', alpha=0.7)
+    finish("box", out_dir)
+
+def plot_hist(values, title, name="hist", out_dir=None):
+    plt.figure(figsize=(8, 6))
+    plt.hist(values, bins=30, edgecolor='black', alpha=0.7)
+    plt.title(title)
+    plt.xlabel("Normalized DTW Distance")
+    plt.ylabel("Frequency")
+    plt.grid(True, linestyle="--", alpha=0.6)
+    finish(name, out_dir)
+
+# ============ Raw Series ============
+COLORS = ["blue", "orange", "green", "red", "purple", "brown"]
+MARKERS = ["o", "s", "^", "D", "v", "x"]
+
+def plot_series(series, interval_ms, title, out_dir=None):
+    """Overlay queue-size series given as (label, ys) pairs."""
+    plt.figure()
+    for k, (label, ys) in enumerate(series):
+        xs = [n * interval_ms for n in range(len(ys))]
+        plt.plot(xs, ys, marker=MARKERS[k % len(MARKERS)], linestyle="-", markersize=3,
+                 color=COLORS[k % len(COLORS)], label=label)
+    plt.xlabel(f"Time (ms) | {interval_ms:g} ms per point")
+    plt.ylabel("Queue Size (bytes)")
+    plt.title(title)
+    plt.grid(True)
+    plt.legend()
+    finish("series", out_dir)
+
+# ============ Live Histogram ============
+class LiveHistogram:
+    def __init__(self):
+        plt.ion()
+        self.fig, self.ax = plt.subplots(figsize=(8, 6))
+
+    def update(self, values, title):
+        ax = self.ax
+        ax.clear()
+        ax.hist(values, bins=25, density=True, alpha=0.7, edgecolor='black')
+        ax.set_xlabel("Normalized DTW Distance")
+        ax.set_ylabel("Density")
+        ax.set_title(title)
+        ax.grid(True, linestyle='--', alpha=0.7)
+        plt.tight_layout()
+        plt.pause(0.1)
+
+    def close(self):
+        plt.ioff()
+        plt.show()
@@ -16,6 +16,11 @@ DST_IP="172.20.1.2"
 PORT=5202
 RATE="12mbit"
 BURST="10k"
+TARGET="1ms"
+TUPDATE=16          # tc's default unit here is us
+LIMIT=15040000      # packets
+ALPHA=0.15625
+BETA=3.195312
 LOG_DIR="./tmp"
 SAMPLE_SEC="0.01"
 TIMEOUT_EXTRA=12
@@ -57,8 +62,13 @@ run_once() {
     rate "$RATE" ceil "$RATE" burst "$BURST"
 
   sudo ip netns exec "$NS_S" $IPROUTE2_PATH qdisc add dev "$VETH_DEV" parent 1:10 handle 2: dualpi2 \
-    target 1ms tupdate 16 limit 15040000 \
-    alpha 0.15625 beta 3.195312
+    target "$TARGET" tupdate "$TUPDATE" limit "$LIMIT" \
+    alpha "$ALPHA" beta "$BETA"
+
+  # Record the configured values (tc echoes alpha/beta rounded) and the htb
+  # class so the run index can pick them up
+  echo "config: rate=$RATE burst=$BURST target=$TARGET tupdate=${TUPDATE}us limit=${LIMIT}p alpha=$ALPHA beta=$BETA" >> "$QDISC_LOG"
+  sudo ip netns exec "$NS_S" $IPROUTE2_PATH class show dev "$VETH_DEV" >> "$QDISC_LOG"
 
   echo "📡 Starting iperf3 server in $NS_R..."
   sudo ip netns exec "$NS_R" iperf3 -s -p "$PORT" >/dev/null 2>&1 &
@@ -75,7 +85,7 @@ run_once() {
     timeout "${LOG_TIME}s" bash -c "
       while sleep $SAMPLE_SEC; do
         {
-          echo \"------ \$(date) ------\"
+          echo \"------ \$(date +%s.%N) ------\"
           sudo ip netns exec $NS_S ss -tin dst $DST_IP
         } >> \"$SS_LOG\"
       done
@@ -87,7 +97,7 @@ run_once() {
     timeout "${LOG_TIME}s" bash -c "
       while sleep $SAMPLE_SEC; do
         {
-          echo \"------ \$(date) ------\"
+          echo \"------ \$(date +%s.%N) ------\"
           sudo ip netns exec $NS_S $IPROUTE2_PATH -s qdisc show dev $VETH_DEV
         } >> \"$QDISC_LOG\"
       done
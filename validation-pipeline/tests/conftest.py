@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The pipeline modules live next to the scripts, not in a package.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
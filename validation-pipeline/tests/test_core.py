@@ -0,0 +1,74 @@
+import pytest
+
+import pipeline_core as core
+from validation_pipeline import main
+
+QDISC_0 = core.QDISC_DIR / "qdisc_0.log"
+QDISC_1 = core.QDISC_DIR / "qdisc_1.log"
+
+# ============ Parsers ============
+def test_read_qdisc_series_checked_in_log():
+    ys = core.read_qdisc_series(QDISC_0)
+    assert len(ys) == 773
+    assert ys[0] == 0
+
+def test_read_mahi_series_skips_other_lines(tmp_path):
+    f = tmp_path / "output_0.txt"
+    f.write_text("queue size in bytes: 10\nnoise\nqueue size in bytes: oops\nqueue size in bytes: 20\n")
+    assert core.read_mahi_series(f) == [10, 20]
+
+def test_list_runs_sorted_by_index(tmp_path):
+    for i in (10, 2, 1):
+        (tmp_path / f"qdisc_{i}.log").write_text("")
+    (tmp_path / "qdisc.log").write_text("")
+    assert [idx for idx, _ in core.list_runs("qdisc", tmp_path)] == [1, 2, 10]
+
+# ============ DTW ============
+def test_dtw_distance_identical_and_shifted():
+    assert core.dtw_distance([1, 2, 3], [1, 2, 3]) == 0
+    assert core.dtw_distance([1, 2, 3], [1, 1, 2, 3]) == 0
+    assert core.dtw_distance([0, 0], [5, 5]) == 10
+
+def test_compute_pair_matches_checked_in_cache():
+    cache = core.load_cache(core.CACHE_FILES["qdisc"])
+    a, b = core.read_qdisc_series(QDISC_0), core.read_qdisc_series(QDISC_1)
+    i, j, d = core.compute_pair((0, 1, a, b))
+    assert (i, j) == (0, 1)
+    assert d == pytest.approx(cache[(0, 1)], abs=1e-6)
+
+def test_compute_pair_empty_series():
+    assert core.compute_pair((0, 1, [], [1])) == (0, 1, None)
+
+def test_run_pairs_single_worker():
+    jobs = [(0, 1, [1, 2], [1, 2]), (0, 2, [1, 2], [3, 4])]
+    assert sorted(core.run_pairs(jobs, workers=1)) == [(0, 1, 0.0), (0, 2, 2.0)]
+
+# ============ Cache Utilities ============
+def test_cache_round_trip(tmp_path):
+    path = tmp_path / "cache.txt"
+    core.write_cache(path, [(0, 1, 1.5)])
+    core.append_to_cache(path, 2, 0, 2.25)
+    assert core.load_cache(path) == {(0, 1): 1.5, (1, 0): 1.5, (2, 0): 2.25, (0, 2): 2.25}
+    assert core.load_cache(path, symmetric=False) == {(0, 1): 1.5, (2, 0): 2.25}
+
+def test_load_dtw_dict_tags_systems(tmp_path):
+    files = {name: tmp_path / f"{name}.txt" for name in ("qdisc", "mahi", "cross")}
+    core.write_cache(files["qdisc"], [(0, 1, 1.0)])
+    core.write_cache(files["mahi"], [(0, 1, 2.0)])
+    core.write_cache(files["cross"], [(0, 1, 3.0)])
+    assert core.load_dtw_dict(files) == {("0_q", "1_q"): 1.0, ("0_m", "1_m"): 2.0, ("0_q", "1_m"): 3.0}
+
+# ============ CLI ============
+def test_stats_rejects_zero_permutations():
+    with pytest.raises(SystemExit):
+        main(["stats", "--permutations", "0"])
+
+def test_render_series_missing_file(tmp_path, capsys):
+    assert main(["render", "series", str(tmp_path / "missing.txt")]) == 1
+    assert "Not found" in capsys.readouterr().out
+
+@pytest.mark.parametrize("command", [["sweep", "intra"], ["sweep", "cross"], ["watch"]])
+@pytest.mark.parametrize("workers", ["0", "-1"])
+def test_workers_must_be_positive(command, workers):
+    with pytest.raises(SystemExit):
+        main([*command, "--workers", workers])
@@ -0,0 +1,206 @@
+import pytest
+
+import pipeline_core as core
+from validation_pipeline import main
+
+QDISC_0 = core.QDISC_DIR / "qdisc_0.log"
+
+def entry(system="qdisc", **config):
+    return {"system": system, "run": 0, "samples": 10, "config": config, "assumed": {}}
+
+def where(*texts):
+    return [core.parse_predicate(t) for t in texts]
+
+# ============ Predicates ============
+def test_parse_predicate():
+    assert core.parse_predicate("alpha=0.15625") == (None, "alpha", "=", "0.15625")
+    assert core.parse_predicate("qdisc.rate >= 12mbit") == ("qdisc", "rate", ">=", "12mbit")
+    with pytest.raises(ValueError):
+        core.parse_predicate("alpha")
+
+def test_parse_assumption():
+    assert core.parse_assumption("qdisc.rate=12mbit") == ("qdisc", "rate", "12mbit")
+    assert core.parse_assumption("rate=") == (None, "rate", "")
+    with pytest.raises(ValueError):
+        core.parse_assumption("tc.rate=12mbit")
+
+def test_tc_echo():
+    assert core.tc_echo("alpha", 0.15625) == 0.15234375
+    assert core.tc_echo("beta", 3.195312) == 3.1875
+    assert core.tc_echo("beta", 3) == pytest.approx(2.996094, abs=1e-6)
+
+def test_matches_echoed_alpha_as_tc_prints_it():
+    e = entry(alpha="0.152344")
+    e["echoed"] = ["alpha"]
+    assert core.matches(e, where("alpha=0.15625"))
+    assert not core.matches(e, where("alpha>0.15625"))
+    assert core.matches(e, where("alpha<0.17"))
+    assert not core.matches(e, where("alpha=0.17"))
+
+def test_matches_configured_alpha_exactly():
+    e = entry(alpha="0.15625")
+    assert core.matches(e, where("alpha=0.15625"))
+    assert not core.matches(e, where("alpha=0.152344"))
+    assert not core.matches(e, where("alpha=0.154"))
+
+def test_matches_normalises_units():
+    e = entry(target="1ms", tupdate="16us", rate="12Mbit", classic_protection="10%")
+    assert core.matches(e, where("target=1000us", "tupdate<1ms", "rate>=12mbit", "classic_protection<20%"))
+    assert not core.matches(e, where("rate>12mbit"))
+
+def test_matches_duration_in_seconds():
+    e = {"system": "qdisc", "run": 0, **core.scan_qdisc_run(QDISC_0)}
+    assert core.matches(e, where("duration>=20s", "duration>=20", "duration<30000ms"))
+    assert not core.matches(e, where("duration>22s"))
+    assert core.matches(e, where("start_ts>=1757371000s"))
+
+def test_matches_strings_missing_fields_and_system_prefix():
+    e = entry(kind="dualpi2")
+    assert core.matches(e, where("kind=DualPI2", "mahi.alpha=1", "beta!=3"))
+    assert not core.matches(e, where("beta=3"))
+    assert core.matches(e, where("samples>5", "run=0"))
+
+def test_assumed_values_only_fill_missing_keys():
+    e = entry(rate="24mbit")
+    e["assumed"] = {"rate": "12mbit", "burst": "10k"}
+    assert core.field(e, "rate") == "24mbit"
+    assert core.field(e, "burst") == "10k"
+
+# ============ Timestamps ============
+@pytest.mark.parametrize("text", [
+    "Mon 08 Sep 2025 03:36:40 PM PDT",
+    "Mon Sep  8 15:36:40 PDT 2025",
+    "2025-09-08T15:36:40-07:00",
+    "1757371000",
+])
+def test_parse_header_time(text):
+    assert core.parse_header_time(text) == 1757371000.0
+
+def test_parse_header_time_unknown_zone():
+    assert core.parse_header_time("Mon Sep  8 15:36:40 XYZ 2025") is None
+    assert core.parse_header_time("2025-09-08T15:36:40") is None
+
+# ============ Scanners ============
+def test_scan_qdisc_run_checked_in_log():
+    run = core.scan_qdisc_run(QDISC_0)
+    assert run["samples"] == len(core.read_qdisc_series(QDISC_0)) == 773
+    assert run["start"] == "Mon 08 Sep 2025 03:36:40 PM PDT"
+    assert run["start_ts"] == 1757371000.0
+    assert run["duration"] == 22.0
+    assert run["config"] == {
+        "kind": "dualpi2", "limit": "15040000p", "target": "1ms", "tupdate": "16us",
+        "alpha": "0.152344", "beta": "3.187500", "coupling_factor": "2",
+        "step_thresh": "1ms", "classic_protection": "10%",
+    }
+
+def test_scan_qdisc_run_configured_values_win(tmp_path):
+    f = tmp_path / "qdisc_0.log"
+    f.write_text("config: rate=12mbit alpha=0.15625\n"
+                 "class htb 1:10 root leaf 2: prio 0 rate 24Mbit ceil 24Mbit burst 10Kb cburst 1600b\n"
+                 + QDISC_0.read_text())
+    config = core.scan_qdisc_run(f)["config"]
+    assert config["alpha"] == "0.15625"
+    assert config["rate"] == "12mbit"
+    assert config["beta"] == "3.187500"
+    assert core.scan_qdisc_run(f)["echoed"] == ["beta"]
+
+def test_scan_mahi_run_maps_queue_args(tmp_path):
+    f = tmp_path / "output_0.txt"
+    f.write_text("start: 1757371000.5\nuplink-queue: dualPI2\n"
+                 "uplink-queue-args: packets=200,target=16,tupdate=16,alpha=0.16,beta=3\n"
+                 "queue size in bytes: 10\nqueue size in bytes: 20\n")
+    run = core.scan_mahi_run(f)
+    assert run["samples"] == 2
+    assert run["start_ts"] == 1757371000.5
+    assert run["duration"] == pytest.approx(0.032)
+    assert run["config"]["limit"] == "200p"
+    assert run["config"]["target"] == "16ms"
+    assert run["config"]["alpha"] == "0.16"
+
+def test_select_checked_in_log_by_configured_values():
+    e = {"system": "qdisc", "run": 0, **core.scan_qdisc_run(QDISC_0)}
+    assert e["echoed"] == ["alpha", "beta"]
+    assert core.matches(e, where("beta=3.195312", "alpha=0.15625"))
+    assert not core.matches(e, where("beta=3.1875"))
+    assert not core.matches(e, where("beta=3.2"))
+
+# ============ Index ============
+@pytest.fixture
+def logs(tmp_path):
+    qdisc_dir, mahi_dir = tmp_path / "q", tmp_path / "o"
+    qdisc_dir.mkdir()
+    mahi_dir.mkdir()
+    (qdisc_dir / "qdisc_0.log").write_text(QDISC_0.read_text())
+    (mahi_dir / "output_3.txt").write_text("uplink-queue-args: alpha=0.15625,beta=3\nqueue size in bytes: 1\n")
+    return {"qdisc": qdisc_dir, "mahi": mahi_dir}
+
+def test_build_index_reuses_unchanged_runs(tmp_path, logs, monkeypatch):
+    index_file = tmp_path / "index.json"
+    core.build_index(index_file, dirs=logs)
+
+    scanned = []
+    monkeypatch.setitem(core.SCANNERS, "qdisc", lambda f: scanned.append(f) or core.scan_qdisc_run(f))
+    runs = core.build_index(index_file)
+    assert scanned == []
+    assert [(e["system"], e["run"]) for e in runs] == [("qdisc", 0), ("mahi", 3)]
+
+    with open(logs["qdisc"] / "qdisc_0.log", "a") as f:
+        f.write("------ 1757371030 ------\n backlog 5b 1p requeues 0\n")
+    runs = core.build_index(index_file)
+    assert len(scanned) == 1
+    assert runs[0]["samples"] == 774
+
+def test_build_index_single_system_keeps_other(tmp_path, logs):
+    index_file = tmp_path / "index.json"
+    core.build_index(index_file, dirs=logs)
+    runs = core.build_index(index_file, systems=("mahi",))
+    assert {e["system"] for e in runs} == {"qdisc", "mahi"}
+
+def test_assumptions_are_scoped_and_overridable(tmp_path, logs):
+    index_file = tmp_path / "index.json"
+    core.build_index(index_file, dirs=logs, assume=[("qdisc", "rate", "12mbit")])
+    runs = core.build_index(index_file, assume=[core.parse_assumption("qdisc.rate=24mbit")])
+    qdisc, mahi = runs
+    assert core.field(qdisc, "rate") == "24mbit"
+    assert "rate" not in qdisc["config"]
+    assert core.field(mahi, "rate") is None
+
+    qdisc, _ = core.build_index(index_file, assume=[("qdisc", "rate", "")])
+    assert core.field(qdisc, "rate") is None
+
+def test_group_runs_lines_up_both_systems(tmp_path, logs):
+    runs = core.build_index(tmp_path / "index.json", dirs=logs)
+    groups = core.group_runs(runs, "alpha")
+    assert len(groups) == 1
+    assert {e["system"] for e in next(iter(groups.values()))} == {"qdisc", "mahi"}
+
+    groups = core.group_runs(runs, "limit")
+    assert sorted(groups, key=core.group_order) == [15040000.0, None]
+
+def test_group_runs_does_not_depend_on_order():
+    old = entry(alpha="0.152344")
+    old["echoed"] = ["alpha"]
+    runs = [entry(alpha="0.154"), old, entry(alpha="0.15625"), entry(alpha="0.152344")]
+    for order in (runs, runs[::-1]):
+        groups = core.group_runs(order, "alpha")
+        assert sorted(groups) == [0.152344, 0.154, 0.15625]
+        assert groups[0.15625] == [runs[2], old] or groups[0.15625] == [old, runs[2]]
+
+def test_parse_where_selects_configured_beta(tmp_path, logs, capsys):
+    index_file = tmp_path / "index.json"
+    main(["parse", "--mode", "qdisc", "--dir", str(logs["qdisc"]), "--index", str(index_file)])
+    capsys.readouterr()
+    main(["parse", "--mode", "qdisc", "--where", "beta=3.195312", "--index", str(index_file)])
+    assert ": 1 runs" in capsys.readouterr().out
+
+# ============ CLI ============
+def test_where_rejects_dir(tmp_path):
+    with pytest.raises(SystemExit, match="cannot be combined"):
+        main(["sweep", "intra", "--dir", str(tmp_path), "--where", "alpha=0.15625"])
+
+def test_where_reports_stale_index(tmp_path, logs, capsys):
+    index_file = tmp_path / "index.json"
+    core.build_index(index_file, dirs=logs)
+    (logs["qdisc"] / "qdisc_0.log").unlink()
+    with pytest.raises(SystemExit, match="Re-run `parse`"):
+        main(["sweep", "intra", "--where", "samples>0", "--index", str(index_file)])
@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""validation-pipeline: parse, sweep, stats, render and watch DTW comparisons.
+
+Usage: python validation_pipeline.py <command> [options]
+  parse                         build the run index and summarise runs
+  sweep intra --mode qdisc      pairwise DTW within one system (cached)
+  sweep cross                   DTW for every qdisc x mahimahi pair
+  stats                         cross-system vs permuted DTW distributions
+  render dtw --mode cross       matrix / CDF / PDF / box plots from a cache
+  render series FILE [FILE...]  queue size over time for raw runs
+  watch                         live histogram while DTWs accumulate
+
+Plotting and stats libraries are imported inside the commands that use
+them, so computing stages and their worker processes start quickly.
+
+sweep, stats, render dtw and watch accept --where KEY=VALUE (also !=, <,
+<=, >, >=; prefix the key with qdisc. or mahi. to target one system) and
+--group-by KEY, answered from the run index so raw logs are only opened
+for the runs that are actually compared.
+"""
+import argparse
+import sys
+from itertools import combinations, product
+from pathlib import Path
+
+import pipeline_core as core
+
+MODE_NAMES = {"qdisc": "QDISC", "mahi": "MAHIMAHI"}
+
+# ============ Run Selection ============
+def selecting(args):
+    if not (args.where or getattr(args, "group_by", None)):
+        return False
+    dirs = [f"--{name.replace('_', '-')}" for name in ("dir", "qdisc_dir", "mahi_dir") if getattr(args, name, None)]
+    if dirs:
+        sys.exit(f"⚠️ {', '.join(dirs)} cannot be combined with --where/--group-by: selected runs come "
+                 f"from the run index. Index that directory with `parse --dir` instead.")
+    return True
+
+def select(args, system):
+    index = core.load_index(args.index)
+    if not index:
+        sys.exit(f"⚠️ No run index at {args.index}. Run `parse` first.")
+    entries = core.select_runs(index, system, args.where)
+    stale = [e for e in entries if not core.run_path(e).exists()]
+    if stale:
+        sys.exit(f"⚠️ {len(stale)} indexed run(s) no longer exist (e.g. {core.run_path(stale[0])}). "
+                 "Re-run `parse` to refresh the index.")
+    return entries
+
+def groups_of(args, entries):
+    """[(label, runs)] for --group-by, or one unlabelled group."""
+    if not getattr(args, "group_by", None):
+        return [("", entries)]
+    groups = core.group_runs(entries, args.group_by)
+    return [(group_label(args, value), groups[value]) for value in sorted(groups, key=core.group_order)]
+
+def paired_groups(args, q_entries, m_entries):
+    """[(label, qdisc runs, mahimahi runs)] for groups holding both systems.
+
+    Both systems are grouped together so equal values line up across them;
+    one-sided groups are reported and skipped.
+    """
+    paired = []
+    for label, group in groups_of(args, q_entries + m_entries):
+        q = [e for e in group if e["system"] == "qdisc"]
+        m = [e for e in group if e["system"] == "mahi"]
+        if not q or not m:
+            print(f"⚠️ {label or 'Selection'}: no {'qdisc' if not q else 'mahimahi'} runs, skipped.")
+            continue
+        paired.append((label, q, m))
+    return paired
+
+def group_label(args, value):
+    if isinstance(value, float):
+        unit = core.FIELD_UNITS.get(args.group_by, "")
+        value = f"{value / core.UNIT_SCALES[unit]:.10g}{unit}"
+    return f"{args.group_by}={value}"
+
+def read_entries(system, entries):
+    reader = core.READERS[system]
+    return {e["run"]: reader(core.run_path(e)) for e in entries}
+
+# ============ parse ============
+def cmd_parse(args):
+    modes = ["qdisc", "mahi"] if args.mode == "all" else [args.mode]
+    if args.dir and len(modes) > 1:
+        print("⚠️ --dir needs --mode qdisc or --mode mahi.")
+        return 1
+    dirs = {mode: args.dir for mode in modes}
+    index = core.build_index(args.index, modes, dirs, args.assume, rebuild=args.rebuild)
+    print(f"Indexed {len(index)} runs in {args.index}")
+    for system in modes:
+        entries = core.select_runs(index, system, args.where)
+        print(f"{MODE_NAMES[system]}: {len(entries)} runs")
+        for e in entries:
+            duration = f"{e['duration']:.1f}s" if e["duration"] is not None else "?"
+            config = " ".join(f"{k}={v}" for k, v in e["config"].items())
+            assumed = " ".join(f"{k}={v}" for k, v in e["assumed"].items() if k not in e["config"])
+            if assumed:
+                config += f"  (assumed: {assumed})"
+            print(f"  {e['run']:>4}  {e['samples']:>6} samples  {duration:>7}  {config}")
+    return 0
+
+# ============ sweep ============
+def cmd_sweep_intra(args):
+    cache_file = Path(args.cache) if args.cache else core.CACHE_FILES[args.mode]
+    selected = selecting(args)
+    print(f"Mode: {MODE_NAMES[args.mode]}")
+    if selected:
+        entries = select(args, args.mode)
+        series_dict = read_entries(args.mode, entries)
+        # Only compare runs that share a configuration group
+        pairs = [pair for _, group in groups_of(args, entries)
+                 for pair in combinations(sorted(e["run"] for e in group), 2)]
+    else:
+        series_dict = core.load_series(args.mode, args.dir)
+        pairs = list(combinations(sorted(series_dict), 2))
+    if not series_dict:
+        print("⚠️ No files found for this mode. Check your directory paths.")
+        return 1
+
+    cache = core.load_cache(cache_file)
+    jobs = [(i, j, series_dict[i], series_dict[j]) for i, j in pairs if (i, j) not in cache]
+
+    print(f"Loaded {len(series_dict)} series.")
+    print(f"Found {len(cache) // 2} cached DTWs.")
+    print(f"Computing {len(jobs)} new pairs...")
+
+    for i, j, d in core.run_pairs(jobs, args.workers):
+        if d is not None:
+            print(f"DTW({i},{j}) = {d:.3f}")
+            core.append_to_cache(cache_file, i, j, d)
+    return 0
+
+def cmd_sweep_cross(args):
+    cache_file = Path(args.cache) if args.cache else core.CACHE_FILES["cross"]
+    if selecting(args):
+        q_entries, m_entries = select(args, "qdisc"), select(args, "mahi")
+        q_series, m_series = read_entries("qdisc", q_entries), read_entries("mahi", m_entries)
+        # Only compare qdisc and mahimahi runs that fall in the same group
+        pairs = [(q["run"], m["run"]) for _, qs, ms in paired_groups(args, q_entries, m_entries)
+                 for q, m in product(qs, ms)]
+    else:
+        q_series = core.load_series("qdisc", args.qdisc_dir)
+        m_series = core.load_series("mahi", args.mahi_dir)
+        pairs = list(product(sorted(q_series), sorted(m_series)))
+    jobs = [(qi, oi, q_series[qi], m_series[oi]) for qi, oi in pairs]
+    print(f"Computing {len(jobs)} DTW pairs (qdisc × mahimahi)...")
+
+    # Merge into the existing cache so a selective sweep keeps other pairs
+    results = core.load_cache(cache_file, symmetric=False)
+    computed = 0
+    for qi, oi, d in core.run_pairs(jobs, args.workers):
+        if d is not None:
+            results[(qi, oi)] = d
+            computed += 1
+            print(f"DTW({qi}, {oi}) = {d:.3f}")
+
+    core.write_cache(cache_file, [(qi, oi, d) for (qi, oi), d in sorted(results.items())])
+    print(f"\nSaved {computed} DTW results to {cache_file}")
+    return 0
+
+# ============ stats ============
+def cross_distances(dtw_data, group_a, group_b):
+    dists = []
+    for a in group_a:
+        for b in group_b:
+            d = dtw_data.get((a, b))
+            if d is None:
+                d = dtw_data.get((b, a))
+            if d is not None:
+                dists.append(d)
+    return dists
+
+def cmd_stats(args):
+    dtw_data = core.load_dtw_dict()
+    labels = {a for pair in dtw_data for a in pair}
+    group_a = sorted(l for l in labels if l.endswith("_q"))
+    group_b = sorted(l for l in labels if l.endswith("_m"))
+    if not selecting(args):
+        return permutation_distributions(dtw_data, group_a, group_b, args)
+
+    groups = paired_groups(args, select(args, "qdisc"), select(args, "mahi"))
+    if not groups:
+        return 1
+    status = 0
+    for label, qs, ms in groups:
+        q_runs = {f"{e['run']}_q" for e in qs}
+        m_runs = {f"{e['run']}_m" for e in ms}
+        if label:
+            print(f"\n===== {label} =====")
+        status |= permutation_distributions(dtw_data, [l for l in group_a if l in q_runs],
+                                           [l for l in group_b if l in m_runs], args, label)
+    return status
+
+def permutation_distributions(dtw_data, group_a, group_b, args, label=""):
+    import numpy as np
+
+    print(f"Found {len(group_a)} Qdisc traces and {len(group_b)} Mahi traces.")
+    if not group_a or not group_b:
+        print("⚠️ Need both qdisc and mahimahi traces. Run `sweep` first.")
+        return 1
+    suffix = f" [{label}]" if label else ""
+    out_dir = args.out / label if args.out and label else args.out
+
+    observed = np.array(cross_distances(dtw_data, group_a, group_b))
+    if not len(observed):
+        print("⚠️ No cross-system DTW distances for these traces. Run `sweep cross` first.")
+        return 1
+    print(f"Collected {len(observed)} cross-system DTW distances, mean {observed.mean():.3f}.")
+
+    if args.plot:
+        import plots
+        plots.plot_hist(observed, f"Cross-System DTW Distance Distribution (Qdisc × Mahi){suffix}",
+                        name="cross_hist", out_dir=out_dir)
+
+    rng = np.random.default_rng(args.seed)
+    all_labels = np.array(group_a + group_b)
+    group_size = len(all_labels) // 2  # keep groups equal size
+
+    print(f"\nRunning {args.permutations} random permutations...")
+    for p in range(args.permutations):
+        shuffled = rng.permutation(all_labels)
+        perm_dists = np.array(cross_distances(dtw_data, shuffled[:group_size], shuffled[group_size:]))
+        if not len(perm_dists):
+            print(f"Permutation {p + 1}: no cached distances between the shuffled groups, skipped")
+            continue
+        print(f"Permutation {p + 1}: {len(perm_dists)} valid distances, mean {perm_dists.mean():.3f}")
+
+        if args.plot:
+            plots.plot_hist(perm_dists, f"Permutation {p + 1} — Randomized DTW Distribution{suffix}",
+                            name=f"permutation_{p + 1}", out_dir=out_dir)
+    return 0
+
+# ============ render ============
+def cmd_render_dtw(args):
+    import plots
+
+    cache_file = Path(args.cache) if args.cache else core.CACHE_FILES[args.mode]
+    is_cross = args.mode == "cross"
+    cache = core.load_cache(cache_file, symmetric=not is_cross)
+    if not cache:
+        print(f"⚠️ No cached distances in {cache_file}. Run `sweep` first.")
+        return 1
+    if not selecting(args):
+        return render_dtw(plots, cache, args)
+
+    if is_cross:
+        groups = paired_groups(args, select(args, "qdisc"), select(args, "mahi"))
+    else:
+        groups = [(label, runs, runs) for label, runs in groups_of(args, select(args, args.mode))]
+    for label, row_runs, col_runs in groups:
+        rows = {e["run"] for e in row_runs}
+        cols = {e["run"] for e in col_runs}
+        subset = {(i, j): d for (i, j), d in cache.items() if i in rows and j in cols}
+        if subset:
+            render_dtw(plots, subset, args, label)
+        else:
+            print(f"⚠️ {label or 'Selection'}: no cached distances, skipped.")
+    return 0
+
+def render_dtw(plots, cache, args, label=""):
+    is_cross = args.mode == "cross"
+    out_dir = args.out / label if args.out and label else args.out
+    if is_cross:
+        values = list(cache.values())
+        suffix = "qdisc × mahimahi"
+    else:
+        values = [d for (i, j), d in cache.items() if i < j]
+        suffix = MODE_NAMES[args.mode]
+    if label:
+        suffix += f", {label}"
+
+    if "matrix" in args.plots:
+        if is_cross:
+            plots.plot_matrix(cache, sorted({i for i, _ in cache}), sorted({j for _, j in cache}),
+                              f"DTW Distance Matrix ({suffix})",
+                              xlabel="Output_Y Index (mahimahi)", ylabel="Qdisc_X Index (qdisc)",
+                              fmt=".3f", cmap="YlGnBu", cbar_label="Normalized DTW Distance",
+                              out_dir=out_dir)
+        else:
+            indices = sorted({i for i, _ in cache})
+            plots.plot_matrix(cache, indices, indices, f"Pairwise Normalized DTW Matrix ({suffix})",
+                              out_dir=out_dir)
+    if "cdf" in args.plots:
+        plots.plot_cdf(values, f"CDF — Normalized DTW ({suffix})", out_dir=out_dir)
+    if "pdf" in args.plots:
+        plots.plot_pdf(values, f"PDF — Normalized DTW ({suffix})", kde=is_cross, out_dir=out_dir)
+    if "box" in args.plots:
+        plots.plot_box(values, f"Box Plot — Normalized DTW Distances ({suffix})", out_dir=out_dir)
+    return 0
+
+def cmd_render_series(args):
+    missing = [str(f) for f in args.files if not f.exists()]
+    if missing:
+        print(f"⚠️ Not found: {', '.join(missing)}")
+        return 1
+
+    series = []
+    for f in args.files:
+        mode = args.mode
+        if mode == "auto":
+            mode = "qdisc" if f.name.startswith("qdisc_") else "mahi"
+        ys = core.READERS[mode](f)
+        if not ys:
+            print(f"⚠️ No {MODE_NAMES[mode]} samples in {f.name}; pass --mode if the file was renamed.")
+        series.append((f.name, ys))
+
+    import plots
+
+    names = " vs ".join(label for label, _ in series)
+    title = f"Queue Size Over Time: {names}" if len(series) == 1 else f"Queue Size Comparison: {names}"
+    plots.plot_series(series, args.interval_ms, title, out_dir=args.out)
+    return 0
+
+# ============ watch ============
+def cmd_watch(args):
+    import plots
+
+    if selecting(args):
+        runs = [(e["run"], core.run_path(e)) for e in select(args, args.mode)]
+    else:
+        runs = core.list_runs(args.mode, args.dir)
+    if not runs:
+        print(f"⚠️ No {MODE_NAMES[args.mode]} files found.")
+        return 1
+
+    print(f"Found {len(runs)} {MODE_NAMES[args.mode]} files.")
+    live = plots.LiveHistogram()
+    loaded = []
+    distance_values = []
+
+    for n, (idx, file_path) in enumerate(runs, start=1):
+        ys = core.READERS[args.mode](file_path)
+        print(f"Loaded file {n}: {file_path.name} ({len(ys)} samples)")
+
+        # Compare this file against all previous ones
+        jobs = [(prev_idx, idx, prev, ys) for prev_idx, prev in loaded]
+        loaded.append((idx, ys))
+        if not jobs:
+            continue
+
+        for i, j, d in core.run_pairs(jobs, args.workers):
+            if d is not None:
+                distance_values.append(d)
+                print(f"DTW({i},{j}) = {d:.3f}")
+
+        live.update(distance_values, f"Live Histogram of DTW Distances (Up to file {n})")
+
+    live.close()
+    return 0
+
+# ============ Argument Parsing ============
+def predicate(text):
+    try:
+        return core.parse_predicate(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+def assumption(text):
+    try:
+        return core.parse_assumption(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def add_selection_args(p, group=True):
+    p.add_argument("--index", type=Path, default=core.INDEX_FILE, help="run index built by `parse`")
+    p.add_argument("--where", type=predicate, action="append", default=[], metavar="KEY=VALUE",
+                   help="only use runs matching this predicate (repeatable)")
+    if group:
+        p.add_argument("--group-by", metavar="KEY", help="only compare runs with equal values of KEY")
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="validation-pipeline",
+                                     description="Mahimahi vs Linux qdisc DTW validation pipeline.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("parse", help="build the run index and summarise runs")
+    p.add_argument("--mode", choices=["qdisc", "mahi", "all"], default="all")
+    p.add_argument("--dir", type=Path, help="override the log directory (single mode only)")
+    p.add_argument("--assume", type=assumption, action="append", default=[], metavar="[SYSTEM.]KEY=VALUE",
+                   help="value for runs whose logs do not record KEY, e.g. qdisc.rate=12mbit; "
+                        "replaces an earlier assumption, an empty VALUE drops it")
+    p.add_argument("--rebuild", action="store_true", help="rescan every run instead of only new or changed ones")
+    add_selection_args(p, group=False)
+    p.set_defaults(func=cmd_parse)
+
+    sweep = sub.add_parser("sweep", help="compute DTW distances").add_subparsers(dest="scope", required=True)
+
+    p = sweep.add_parser("intra", help="pairwise DTW within one system")
+    p.add_argument("--mode", choices=["qdisc", "mahi"], default="qdisc")
+    p.add_argument("--dir", type=Path, help="override the log directory")
+    p.add_argument("--cache", type=Path, help="override the cache file")
+    p.add_argument("--workers", type=positive_int, help="worker processes (default: cpu_count - 1)")
+    add_selection_args(p)
+    p.set_defaults(func=cmd_sweep_intra)
+
+    p = sweep.add_parser("cross", help="DTW for every qdisc x mahimahi pair")
+    p.add_argument("--qdisc-dir", type=Path)
+    p.add_argument("--mahi-dir", type=Path)
+    p.add_argument("--cache", type=Path, help="override the output file")
+    p.add_argument("--workers", type=positive_int, help="worker processes (default: cpu_count - 1)")
+    add_selection_args(p)
+    p.set_defaults(func=cmd_sweep_cross)
+
+    p = sub.add_parser("stats", help="cross-system vs permuted DTW distributions")
+    p.add_argument("--permutations", type=positive_int, default=20)
+    p.add_argument("--seed", type=int)
+    p.add_argument("--plot", action="store_true", help="plot the observed and permuted histograms")
+    p.add_argument("--out", type=Path, help="save plots to this directory instead of showing them")
+    add_selection_args(p)
+    p.set_defaults(func=cmd_stats)
+
+    render = sub.add_parser("render", help="plot cached or raw data").add_subparsers(dest="what", required=True)
+
+    p = render.add_parser("dtw", help="plots from a DTW cache")
+    p.add_argument("--mode", choices=["qdisc", "mahi", "cross"], default="qdisc")
+    p.add_argument("--cache", type=Path, help="override the cache file")
+    p.add_argument("--plots", nargs="+", choices=["matrix", "cdf", "pdf", "box"],
+                   default=["matrix", "cdf", "pdf", "box"])
+    p.add_argument("--out", type=Path, help="save plots to this directory instead of showing them")
+    add_selection_args(p)
+    p.set_defaults(func=cmd_render_dtw)
+
+    p = render.add_parser("series", help="queue size over time for raw runs")
+    p.add_argument("files", nargs="+", type=Path)
+    p.add_argument("--mode", choices=["auto", "qdisc", "mahi"], default="auto",
+                   help="log format (default: qdisc for qdisc_* files, otherwise mahi)")
+    p.add_argument("--interval-ms", type=float, default=core.MAHI_SAMPLE_MS)
+    p.add_argument("--out", type=Path, help="save the plot to this directory instead of showing it")
+    p.set_defaults(func=cmd_render_series)
+
+    p = sub.add_parser("watch", help="live DTW histogram as runs are loaded")
+    p.add_argument("--mode", choices=["qdisc", "mahi"], default="mahi")
+    p.add_argument("--dir", type=Path, help="override the log directory")
+    p.add_argument("--workers", type=positive_int, help="worker processes (default: cpu_count - 1)")
+    add_selection_args(p, group=False)
+    p.set_defaults(func=cmd_watch)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+if __name__ == "__main__":
+    sys.exit(main())